@@ -1,16 +1,44 @@
-from .client import ABClient
-from .config import SDKConfig
-from .decoder import GenericSpikeDecoder
-from .encoder import SpikeEncoder
-from .robot_loop import RewardPayload, RobotLoop
-from .session import RealtimeSession
+import importlib
+
+# Public names resolved lazily (PEP 562) so `import ab_sdk` does not pay for
+# httpx/socketio until a client or session is actually used.
+_LAZY = {
+    "ABClient": ".client",
+    "AsyncNodeRealtimeClient": ".aclient",
+    "AsyncPythonRealtimeClient": ".aclient",
+    "SDKConfig": ".config",
+    "RealtimeSession": ".session",
+    "SpikeEncoder": ".encoder",
+    "GenericSpikeDecoder": ".decoder",
+    "MappingEntry": ".decoder",
+    "deltas_to_dq_dg": ".decoder",
+    "RobotLoop": ".robot_loop",
+    "RewardPayload": ".robot_loop",
+}
 
 __all__ = [
     "ABClient",
+    "AsyncNodeRealtimeClient",
+    "AsyncPythonRealtimeClient",
     "SDKConfig",
     "RealtimeSession",
     "SpikeEncoder",
     "GenericSpikeDecoder",
+    "MappingEntry",
+    "deltas_to_dq_dg",
     "RobotLoop",
     "RewardPayload",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,304 @@
+# ab_sdk/aclient.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import httpx
+
+from . import endpoints
+from .node_client import HTTP2_AVAILABLE
+
+
+class AsyncNodeRealtimeClient:
+    """Async mirror of `NodeRealtimeClient` built on `httpx.AsyncClient`.
+
+    Lets callers await broker calls concurrently with other I/O instead of
+    blocking a thread per request.
+    """
+
+    def __init__(self, base_url: str, *, api_key: Optional[str] = None, timeout: float = 20.0) -> None:
+        if not base_url:
+            raise ValueError("node base_url must be provided")
+        self.base_url = base_url.rstrip("/")
+        headers: Dict[str, str] = {}
+        if api_key:
+            headers["x-api-key"] = api_key
+            headers["Authorization"] = f"Bearer {api_key}"
+        self.http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=httpx.Timeout(
+                connect=5.0,
+                read=float(timeout),
+                write=10.0,
+                pool=5.0,
+            ),
+            # Pool limits and HTTP/2 must be configured on the transport:
+            # when an explicit transport is passed, httpx ignores the
+            # Client-level `limits=`/`http2=` kwargs entirely.
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0,
+                ),
+            ),
+        )
+
+    async def close(self) -> None:
+        await self.http.aclose()
+
+    async def initialize(self, project_id: str, **kwargs: Any) -> Dict[str, Any]:
+        path = endpoints.resolve(endpoints.NODE_INITIALIZE, project_id=project_id)
+        resp = await self.http.post(path, json={**kwargs})
+        return self._json_or_raise(resp, "initialize")
+
+    async def start_telemetry(self, project_id: str, compile_id: str) -> Dict[str, Any]:
+        path = endpoints.resolve(endpoints.NODE_TELEMETRY_START, project_id=project_id)
+        resp = await self.http.post(path, json={"compileId": compile_id})
+        return self._json_or_raise(resp, "start_telemetry")
+
+    async def run_stop(self, project_id: str, compile_id: str) -> Dict[str, Any]:
+        path = endpoints.resolve(endpoints.NODE_RUN_STOP, project_id=project_id)
+        resp = await self.http.post(path, json={"compileId": compile_id})
+        return self._json_or_raise(resp, "run_stop")
+
+    async def sdk_run_stopped(self, project_id: str, compile_id: str) -> Dict[str, Any]:
+        path = endpoints.resolve(endpoints.NODE_SDK_RUN_STOPPED, project_id=project_id)
+        resp = await self.http.post(path, json={"compileId": compile_id})
+        return self._json_or_raise(resp, "sdk_run_stopped")
+
+    async def get_session(self, project_id: str, compile_id: str) -> Dict[str, Any]:
+        path = endpoints.resolve(endpoints.NODE_SESSION, project_id=project_id, compile_id=compile_id)
+        resp = await self.http.get(path)
+        return self._json_or_raise(resp, "get_session")
+
+    async def claim_webots_credentials(self, project_id: str, temp_token: str) -> Dict[str, Any]:
+        path = endpoints.resolve(endpoints.NODE_WEBOTS_CREDENTIALS, project_id=project_id)
+        resp = await self.http.post(
+            path,
+            json={
+                "projectId": project_id,
+                "tempToken": temp_token,
+            },
+            headers={
+                "x-temp-token": temp_token,
+            },
+        )
+        return self._json_or_raise(resp, "claim_webots_credentials")
+
+    async def checkpoint(self, project_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        path = endpoints.resolve(endpoints.NODE_CHECKPOINT, project_id=project_id)
+        resp = await self.http.post(path, json=payload, timeout=60.0)
+        return self._json_or_raise(resp, "checkpoint")
+
+    async def publish_output(self, project_id: str, compile_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        path = endpoints.resolve(
+            endpoints.NODE_OUTPUT_TELEMETRY,
+            project_id=project_id,
+            compile_id=compile_id,
+        )
+        resp = await self.http.post(path, json=payload)
+        return self._json_or_raise(resp, "publish_output")
+
+    async def clear_output_cache(self, project_id: str, compile_id: str) -> Dict[str, Any]:
+        path = endpoints.resolve(
+            endpoints.NODE_OUTPUT_TELEMETRY_CLEAR,
+            project_id=project_id,
+            compile_id=compile_id,
+        )
+        resp = await self.http.post(path, json={"compileId": compile_id})
+        return self._json_or_raise(resp, "clear_output_cache")
+
+    @staticmethod
+    def _json_or_raise(resp: httpx.Response, op: str) -> Dict[str, Any]:
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            raise RuntimeError(
+                f"Node {op} failed: status={resp.status_code}, body={resp.text}"
+            ) from exc
+        return resp.json()
+
+
+class AsyncPythonRealtimeClient:
+    """Async mirror of `PythonRealtimeClient`.
+
+    The output polling loop is the hottest REST path in the SDK; with this
+    client it can be awaited concurrently with input publishing, e.g.
+
+        results = await asyncio.gather(
+            client.send_input(payload=payload),
+            client.get_outputs(compile_id=cid, after_step=step),
+        )
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        api_key: Optional[str] = None,
+        project_id: Optional[str] = None,
+        timeout: float = 20.0,
+    ) -> None:
+        if not base_url:
+            raise ValueError("python base_url must be provided")
+        self.base_url = base_url.rstrip("/")
+        headers: Dict[str, str] = {}
+        if project_id:
+            headers["x-project-id"] = project_id
+        if api_key:
+            headers["x-api-key"] = api_key
+            headers["Authorization"] = f"Bearer {api_key}"
+        self.http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=httpx.Timeout(
+                connect=5.0,
+                read=float(timeout),
+                write=10.0,
+                pool=5.0,
+            ),
+            # Pool limits and HTTP/2 must be configured on the transport:
+            # when an explicit transport is passed, httpx ignores the
+            # Client-level `limits=`/`http2=` kwargs entirely.
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0,
+                ),
+            ),
+        )
+
+    async def close(self) -> None:
+        await self.http.aclose()
+
+    async def compile_direct(
+        self,
+        *,
+        graph: Dict[str, Any],
+        compile_id: str,
+        signals_token: Optional[str] = None,
+        signals: Optional[Dict[str, Any]] = None,
+        load_weights: Optional[list[dict[str, Any]]] = None,
+        load_state: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        payload = {
+            "graph": graph,
+            "compileId": compile_id,
+            "signals_token": signals_token,
+            "signals": signals,
+            "load_weights": load_weights,
+            "load_state": load_state,
+        }
+        resp = await self.http.post(endpoints.PY_COMPILE, json=payload)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def run_start(self, compile_id: str, **kwargs: Any) -> Dict[str, Any]:
+        payload = {"compileId": compile_id, **kwargs}
+        resp = await self.http.post(endpoints.PY_RUN_START, json=payload)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def run_stop(self, compile_id: str, **kwargs: Any) -> Dict[str, Any]:
+        payload = {"compileId": compile_id, **kwargs}
+        resp = await self.http.post(endpoints.PY_RUN_STOP, json=payload)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def send_input(self, *, payload: Dict[str, Any]) -> Dict[str, Any]:
+        resp = await self.http.post(endpoints.PY_INPUTS, json=payload)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def send_global_reward(
+        self,
+        *,
+        compile_id: str,
+        value: float,
+        drive: Optional[float] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        payload = {
+            "compileId": compile_id,
+            "scope": "global",
+            "value": float(value),
+            "drive": float(drive) if drive is not None else None,
+            "meta": meta or {},
+        }
+        resp = await self.http.post(endpoints.PY_REWARDS, json=payload)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def send_local_rewards(
+        self,
+        *,
+        compile_id: str,
+        rewards: Dict[str, float],
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        results = []
+        for target, value in rewards.items():
+            payload = {
+                "compileId": compile_id,
+                "scope": "local",
+                "target": str(target),
+                "value": float(value),
+                "meta": meta or {},
+            }
+            resp = await self.http.post(endpoints.PY_REWARDS, json=payload)
+            resp.raise_for_status()
+            results.append(resp.json())
+        return {"ok": True, "results": results}
+
+    async def send_local_rewards_batch(
+        self,
+        *,
+        compile_id: str,
+        rewards: Dict[str, Any],
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        payload = {
+            "compileId": compile_id,
+            "items": [
+                {
+                    "scope": "local",
+                    "target": str(target),
+                    "value": float(
+                        value.get("value") if isinstance(value, dict) else value
+                    ),
+                    "drive": (
+                        float(value.get("drive"))
+                        if isinstance(value, dict) and value.get("drive") is not None
+                        else None
+                    ),
+                    "meta": meta or {},
+                }
+                for target, value in rewards.items()
+            ],
+        }
+        resp = await self.http.post(endpoints.PY_REWARDS, json=payload)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def get_outputs(self, *, compile_id: str, after_step: Optional[int] = None, limit: int = 100) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": limit}
+        if after_step is not None:
+            params["after_step"] = after_step
+        path = endpoints.resolve(endpoints.PY_OUTPUTS, compile_id=compile_id)
+        resp = await self.http.get(path, params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def get_weights(self, *, compile_id: str) -> Dict[str, Any]:
+        path = endpoints.resolve(endpoints.PY_WEIGHTS, compile_id=compile_id)
+        resp = await self.http.get(path)
+        resp.raise_for_status()
+        return resp.json()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from pathlib import Path
@@ -14,6 +15,70 @@ from .node_client import NodeRealtimeClient
 from .python_client import PythonRealtimeClient
 from .session import RealtimeSession, SessionConfig
 
+try:
+    import orjson  # optional: sorts keys inline in C, no per-dict sorted() pass
+except ImportError:
+    orjson = None
+
+# Rendered debug payloads keyed by object identity, so re-initializing with
+# the same response dict skips the json.dumps pass. Bounded FIFO.
+_DEBUG_RENDER_CACHE: Dict[int, tuple] = {}
+_DEBUG_RENDER_CACHE_MAX = 8
+
+# Digest of what this process last wrote per artifact path; lets the
+# unchanged-payload path skip even the sidecar read.
+_LAST_WRITTEN_SHA: Dict[str, str] = {}
+
+# Directories already created this process; skips the mkdir stat chain on
+# every initialize after the first.
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    key = str(path)
+    if key in _ENSURED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(key)
+
+
+def _render_debug_payload(payload: Dict[str, Any]) -> tuple[bytes, str]:
+    """Render to UTF-8 bytes plus sha256, memoized on payload identity."""
+    key = id(payload)
+    hit = _DEBUG_RENDER_CACHE.get(key)
+    # The cache keeps a strong reference to the payload, so an id hit that
+    # passes the identity check cannot be a recycled address.
+    if hit is not None and hit[0] is payload:
+        return hit[1], hit[2]
+
+    if orjson is not None:
+        rendered = orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+    else:
+        rendered = json.dumps(payload, indent=2, sort_keys=True, default=str).encode("utf-8")
+
+    # One-shot digest over a view: no second bytes copy feeds the hash.
+    sha = hashlib.sha256(memoryview(rendered)).hexdigest()
+
+    if len(_DEBUG_RENDER_CACHE) >= _DEBUG_RENDER_CACHE_MAX:
+        _DEBUG_RENDER_CACHE.pop(next(iter(_DEBUG_RENDER_CACHE)))
+    _DEBUG_RENDER_CACHE[key] = (payload, rendered, sha)
+    return rendered, sha
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """One open/write/close in binary mode, made visible via os.replace.
+
+    Readers (and crashed writers) never observe a half-written artifact.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
 
 class ABClient:
     """Artificial Brains realtime SDK.
@@ -50,6 +115,9 @@ class ABClient:
         if not api_key:
             raise ValueError("ABClient requires an API key. Pass api_key or set AB_API_KEY.")
 
+        # Resolved once here; start() and client rebuilds reuse it instead of
+        # re-reading the environment per call.
+        self._api_key = api_key
         self.node = NodeRealtimeClient(node_url, api_key=api_key, timeout=timeout) if node_url else None
         self.python = PythonRealtimeClient(
             python_url,
@@ -61,6 +129,11 @@ class ABClient:
         self.output_limit = output_limit
         self.output_telemetry = output_telemetry
 
+    def close(self) -> None:
+        if self.node:
+            self.node.close()
+        self.python.close()
+
     @classmethod
     def from_config(cls, config: SDKConfig) -> "ABClient":
         return cls(
@@ -100,16 +173,47 @@ class ABClient:
         *,
         project_id: str,
         init_payload: Dict[str, Any],
+        force: bool = False,
     ) -> None:
         debug_dir = Path(os.getenv("AB_DEBUG_DIR", ".ab_debug"))
-        debug_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(debug_dir)
 
         # single file, always overwritten
         path = debug_dir / f"{project_id}_latest.json"
-
-        path.write_text(json.dumps(init_payload, indent=2, sort_keys=True, default=str))
+        sha_path = debug_dir / f"{project_id}_latest.sha256"
+
+        rendered, sha = _render_debug_payload(init_payload)
+
+        # Content-addressed short-circuit: skip the rewrite when the payload
+        # on disk already matches.
+        if not force:
+            existing = _LAST_WRITTEN_SHA.get(str(path))
+            if existing is None:
+                # One directory scan covers both artifact files instead of a
+                # stat per path.
+                try:
+                    names = {entry.name for entry in os.scandir(debug_dir)}
+                except OSError:
+                    names = set()
+                if path.name in names and sha_path.name in names:
+                    try:
+                        existing = sha_path.read_text().strip()
+                    except OSError:
+                        existing = None
+            if existing == sha:
+                print(f"[AB] debug payload unchanged, skipping write: {path}")
+                self._print_contract_summary(init_payload)
+                return
+
+        _write_bytes_atomic(path, rendered)
+        _write_bytes_atomic(sha_path, (sha + "\n").encode("ascii"))
+        _LAST_WRITTEN_SHA[str(path)] = sha
 
         print(f"[AB] wrote debug payload: {path}")
+        self._print_contract_summary(init_payload)
+
+    @staticmethod
+    def _print_contract_summary(init_payload: Dict[str, Any]) -> None:
 
         contract = init_payload.get("contract") or {}
         inputs = contract.get("inputs") or []
@@ -148,12 +252,25 @@ class ABClient:
                 port = init_payload["port"]
                 python_url = f"http://127.0.0.1:{port}"
 
-            self.python = PythonRealtimeClient(
-                python_url,
-                api_key=os.getenv("AB_API_KEY"),
-                project_id=project_id,
-                timeout=10.0,
-            )
+            # Reuse the existing client (and its warm connection pool) when a
+            # stop/restart lands on the same runtime; only rebuild on a move.
+            if self.python.base_url != python_url.rstrip("/"):
+                self.python.close()
+                self.python = PythonRealtimeClient(
+                    python_url,
+                    api_key=self._api_key,
+                    project_id=project_id,
+                    timeout=10.0,
+                )
+            elif self.python.http.headers.get("x-project-id") != project_id:
+                # The client built in __init__ carries AB_PROJECT_ID (often
+                # unset), and a reused client may still hold a previous
+                # start()'s project. Refresh the header in place so the warm
+                # pool keeps serving, but for the right project.
+                if project_id:
+                    self.python.http.headers["x-project-id"] = project_id
+                else:
+                    self.python.http.headers.pop("x-project-id", None)
 
 
             run_resp = self.python.run_start(compile_id, **run_kwargs)
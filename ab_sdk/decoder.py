@@ -2,27 +2,121 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from collections import defaultdict
+import functools
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 import re
 
+try:
+    import numpy as np  # optional: C-loop reductions over wide bit rows
+except ImportError:
+    np = None
+
 OutputEvent = Dict[str, Any]
 Command = Dict[str, Any]
 
+# Dense spike row, one element per neuron (0/1). Extraction produces
+# bytearrays — byte-wide unboxed storage that works with or without
+# numpy — but hand-built int sequences are accepted everywhere too.
+BitRow = Union[bytes, bytearray, Sequence[int]]
+
+
+def _bits_array(bits: BitRow):
+    """uint8 ndarray over ``bits`` (zero-copy for bytes-like), or None."""
+    if np is None:
+        return None
+    if isinstance(bits, (bytes, bytearray, memoryview)):
+        return np.frombuffer(bits, dtype=np.uint8)
+    return np.asarray(bits, dtype=np.uint8)
+
+
+# Integer scheme tags so the per-row dispatch compares ints, not strings.
+_SCHEME_BIPOLAR_SPLIT = 0
+_SCHEME_ADDITION = 1
+_SCHEME_BOOLEAN_THRESHOLD = 2
+_SCHEME_BIPOLAR_SCALAR = 3
+
+_SCHEME_IDS = {
+    "bipolarSplit": _SCHEME_BIPOLAR_SPLIT,
+    "addition": _SCHEME_ADDITION,
+    "booleanThreshold": _SCHEME_BOOLEAN_THRESHOLD,
+    "bipolarScalar": _SCHEME_BIPOLAR_SCALAR,
+}
+
 
-@dataclass
 class MappingEntry:
-    output_id: str
-    channel: str
-    scheme: str = "bipolarSplit"   # bipolarSplit | addition | booleanThreshold | bipolarScalar
-    per_step_max: float = 0.01
-    gain: float = 1.0
-    deadzone: float = 0.0
-    min_step: float = 0.0
-    invert: bool = False
-    threshold: Optional[int] = None
-    clamp: Optional[Tuple[float, float]] = None
-    n: Optional[int] = None
+    """One normalized mapping row: an output population feeding a channel.
+
+    Slotted rather than a dataclass: every decoded event touches every
+    entry, and __slots__ keeps the instances dict-free with cheap
+    attribute loads. (dataclass slots=True needs 3.10; this tree supports
+    3.8.)
+    """
+
+    __slots__ = (
+        "output_id",
+        "channel",
+        "scheme",      # bipolarSplit | addition | booleanThreshold | bipolarScalar
+        "per_step_max",
+        "gain",
+        "deadzone",
+        "min_step",
+        "invert",
+        "threshold",
+        "clamp",
+        "n",
+        # derived once at construction; decode() reads these instead of
+        # re-parsing the scheme string and re-multiplying floats per row
+        "scheme_id",
+        "scale",
+        "clamp_lo",
+        "clamp_hi",
+    )
+
+    def __init__(
+        self,
+        output_id: str,
+        channel: str,
+        scheme: str = "bipolarSplit",
+        per_step_max: float = 0.01,
+        gain: float = 1.0,
+        deadzone: float = 0.0,
+        min_step: float = 0.0,
+        invert: bool = False,
+        threshold: Optional[int] = None,
+        clamp: Optional[Tuple[float, float]] = None,
+        n: Optional[int] = None,
+    ) -> None:
+        self.output_id = output_id
+        self.channel = channel
+        self.scheme = scheme
+        self.per_step_max = per_step_max
+        self.gain = gain
+        self.invert = invert
+        self.threshold = threshold
+        self.clamp = clamp
+        self.n = n
+
+        # Entries are treated as frozen after construction.
+        self.scheme_id = _SCHEME_IDS.get((scheme or "bipolarSplit").strip(), -1)
+        self.scale = float(per_step_max) * float(gain) * (-1.0 if invert else 1.0)
+        self.deadzone = float(deadzone)
+        self.min_step = float(min_step)
+        if clamp is not None and isinstance(clamp, (tuple, list)) and len(clamp) == 2:
+            self.clamp_lo: Optional[float] = float(clamp[0])
+            self.clamp_hi: Optional[float] = float(clamp[1])
+        else:
+            self.clamp_lo = None
+            self.clamp_hi = None
+
+    def __repr__(self) -> str:
+        return (
+            f"MappingEntry(output_id={self.output_id!r}, channel={self.channel!r}, "
+            f"scheme={self.scheme!r}, per_step_max={self.per_step_max!r}, "
+            f"gain={self.gain!r}, deadzone={self.deadzone!r}, "
+            f"min_step={self.min_step!r}, invert={self.invert!r}, "
+            f"threshold={self.threshold!r}, clamp={self.clamp!r}, n={self.n!r})"
+        )
 
 
 def _clamp(x: float, lo: float, hi: float) -> float:
@@ -33,23 +127,29 @@ def _clamp(x: float, lo: float, hi: float) -> float:
 # Schemes: bits -> scalar
 # ----------------------------
 
-def _bipolar_split(bits: List[int]) -> float:
+def _bipolar_split(bits: BitRow) -> float:
     n = len(bits)
     if n < 2:
         return 0.0
     half = n // 2
     if half <= 0:
         return 0.0
+    arr = _bits_array(bits)
+    if arr is not None:
+        return float(int(arr[:half].sum()) - int(arr[half:half * 2].sum()))
     pos = sum(bits[:half])
     neg = sum(bits[half:half * 2])
     return float(pos - neg)
 
 
-def _addition(bits: List[int]) -> float:
+def _addition(bits: BitRow) -> float:
+    arr = _bits_array(bits)
+    if arr is not None:
+        return float(int(arr.sum()))
     return float(sum(bits))
 
 
-def _boolean_threshold(bits: List[int], threshold: int) -> float:
+def _boolean_threshold(bits: BitRow, threshold: int) -> float:
     n = len(bits)
     if n <= 0:
         return 0.0
@@ -58,18 +158,25 @@ def _boolean_threshold(bits: List[int], threshold: int) -> float:
         thr = 1
     if thr > n:
         thr = n
-    return 1.0 if sum(bits) >= thr else 0.0
+    arr = _bits_array(bits)
+    total = int(arr.sum()) if arr is not None else sum(bits)
+    return 1.0 if total >= thr else 0.0
 
 
-def _bipolar_scalar(bits: List[int]) -> float:
+def _bipolar_scalar(bits: BitRow) -> float:
     n = len(bits)
     if n < 2:
         return 0.0
     half = n // 2
     if half <= 0:
         return 0.0
-    pos = sum(bits[:half])
-    neg = sum(bits[half:half * 2])
+    arr = _bits_array(bits)
+    if arr is not None:
+        pos = int(arr[:half].sum())
+        neg = int(arr[half:half * 2].sum())
+    else:
+        pos = sum(bits[:half])
+        neg = sum(bits[half:half * 2])
     if pos > neg:
         return 1.0
     if neg > pos:
@@ -77,46 +184,99 @@ def _bipolar_scalar(bits: List[int]) -> float:
     return 0.0
 
 
-def _compute_value(bits: List[int], entry: MappingEntry) -> float:
-    scheme = (entry.scheme or "bipolarSplit").strip()
+def _compute_value(bits: BitRow, entry: MappingEntry) -> float:
+    scheme_id = entry.scheme_id
 
-    if scheme == "bipolarSplit":
+    if scheme_id == _SCHEME_BIPOLAR_SPLIT:
         return _bipolar_split(bits)
 
-    if scheme == "addition":
+    if scheme_id == _SCHEME_ADDITION:
         return _addition(bits)
 
-    if scheme == "booleanThreshold":
+    if scheme_id == _SCHEME_BOOLEAN_THRESHOLD:
         thr = entry.threshold
         if thr is None:
             thr = max(1, len(bits) // 2)
         return _boolean_threshold(bits, int(thr))
 
-    if scheme == "bipolarScalar":
+    if scheme_id == _SCHEME_BIPOLAR_SCALAR:
         return _bipolar_scalar(bits)
 
     return 0.0
 
 
 def _value_to_delta(value: float, entry: MappingEntry) -> float:
-    if entry.invert:
-        value = -value
+    # entry.scale already folds per_step_max, gain, and invert.
+    delta = float(value) * entry.scale
 
-    delta = float(value) * float(entry.per_step_max) * float(entry.gain)
-
-    if entry.deadzone and abs(delta) < float(entry.deadzone):
+    if entry.deadzone and abs(delta) < entry.deadzone:
         return 0.0
 
-    if entry.min_step and 0.0 < abs(delta) < float(entry.min_step):
-        delta = float(entry.min_step) if delta > 0 else -float(entry.min_step)
+    if entry.min_step and 0.0 < abs(delta) < entry.min_step:
+        delta = entry.min_step if delta > 0 else -entry.min_step
 
-    if entry.clamp is not None and isinstance(entry.clamp, (tuple, list)) and len(entry.clamp) == 2:
-        lo, hi = float(entry.clamp[0]), float(entry.clamp[1])
-        delta = _clamp(delta, lo, hi)
+    if entry.clamp_lo is not None:
+        delta = _clamp(delta, entry.clamp_lo, entry.clamp_hi)
 
     return delta
 
 
+def _compile_entry(entry: MappingEntry):
+    """Build a bits -> delta closure specialized for one entry.
+
+    All per-entry constants (kernel, scale, shaping thresholds) are bound
+    into the closure once, so the decode loop pays no dispatch or
+    attribute loads per row. Entries with no shaping collapse to the bare
+    kernel, optionally scaled.
+    """
+    scheme_id = entry.scheme_id
+    scale = entry.scale
+    deadzone = entry.deadzone
+    min_step = entry.min_step
+    clamp_lo = entry.clamp_lo
+    clamp_hi = entry.clamp_hi
+
+    if scheme_id == _SCHEME_BIPOLAR_SPLIT:
+        kernel = _bipolar_split
+    elif scheme_id == _SCHEME_ADDITION:
+        kernel = _addition
+    elif scheme_id == _SCHEME_BOOLEAN_THRESHOLD:
+        if entry.threshold is not None:
+            thr = int(entry.threshold)
+
+            def kernel(bits, _thr=thr):
+                return _boolean_threshold(bits, _thr)
+        else:
+
+            def kernel(bits):
+                return _boolean_threshold(bits, max(1, len(bits) // 2))
+    elif scheme_id == _SCHEME_BIPOLAR_SCALAR:
+        kernel = _bipolar_scalar
+    else:
+        return lambda bits: 0.0
+
+    if not deadzone and not min_step and clamp_lo is None:
+        if scale == 1.0:
+            return kernel
+
+        def run_scaled(bits):
+            return kernel(bits) * scale
+
+        return run_scaled
+
+    def run(bits):
+        delta = kernel(bits) * scale
+        if deadzone and abs(delta) < deadzone:
+            return 0.0
+        if min_step and 0.0 < abs(delta) < min_step:
+            delta = min_step if delta > 0 else -min_step
+        if clamp_lo is not None:
+            delta = _clamp(delta, clamp_lo, clamp_hi)
+        return delta
+
+    return run
+
+
 def normalize_mapping(mapping: Iterable[Union[MappingEntry, Dict[str, Any]]]) -> List[MappingEntry]:
     out: List[MappingEntry] = []
 
@@ -175,11 +335,45 @@ def normalize_mapping(mapping: Iterable[Union[MappingEntry, Dict[str, Any]]]) ->
 
 _NEURON_ID_RX = re.compile(r"^([^:]+):(\d+)$")
 
+# Shared zero template for wiping reused rows; memoryview slices of it are
+# zero-copy, so re-zeroing a pooled buffer allocates nothing.
+_ZEROS = bytes(64)
+
 
-def _extract_bits_by_output(output_event: OutputEvent, mapping: List[MappingEntry]) -> Dict[str, List[int]]:
+def _zero_fill(row: bytearray) -> None:
+    global _ZEROS
+    n = len(row)
+    if len(_ZEROS) < n:
+        _ZEROS = bytes(n)
+    row[:n] = memoryview(_ZEROS)[:n]
+
+
+def _configured_widths(mapping: List[MappingEntry]) -> Dict[str, int]:
+    """Widest declared n per output id, for preallocating dense rows."""
+    widths: Dict[str, int] = {}
+    for entry in mapping:
+        if entry.n is None or entry.n <= 0:
+            continue
+        width = int(entry.n)
+        if width > widths.get(entry.output_id, 0):
+            widths[entry.output_id] = width
+    return widths
+
+
+def _extract_bits_by_output(
+    output_event: OutputEvent,
+    mapping: List[MappingEntry],
+    pool: Optional[Dict[str, bytearray]] = None,
+    widths: Optional[Dict[str, int]] = None,
+) -> Dict[str, bytearray]:
     """
     Rebuild dense bits from runtime sparse spike events.
 
+    When ``pool`` is given, rows for configured outputs are drawn from it
+    (re-zeroed in place) instead of freshly allocated, and the pool keeps
+    them for the next call. Pooled rows are therefore only valid until the
+    next extraction with the same pool.
+
     output_event shape:
         {
             "step": int,
@@ -190,12 +384,27 @@ def _extract_bits_by_output(output_event: OutputEvent, mapping: List[MappingEntr
             "telemetry": {...}
         }
     """
-    configured_n: Dict[str, int] = {}
-    for entry in mapping:
-        if entry.n is not None and entry.n > 0:
-            configured_n[entry.output_id] = max(configured_n.get(entry.output_id, 0), int(entry.n))
-
-    active_by_output: Dict[str, set[int]] = {}
+    # Dense rows are bytearrays: one byte per bit instead of a boxed int,
+    # and the numpy path in the scheme kernels can view them zero-copy.
+    # Rows for configured outputs are allocated up front at their declared
+    # width; the neuron sweep below then writes bits straight into them —
+    # no intermediate per-output index sets, no second grouping pass.
+    if widths is None:
+        widths = _configured_widths(mapping)
+
+    bits_by_output: Dict[str, bytearray] = {}
+    for output_id, width in widths.items():
+        if pool is not None:
+            pooled = pool.get(output_id)
+            if pooled is not None and len(pooled) == width:
+                _zero_fill(pooled)
+                row = pooled
+            else:
+                row = bytearray(width)
+                pool[output_id] = row
+        else:
+            row = bytearray(width)
+        bits_by_output[output_id] = row
 
     seq = output_event.get("outputs")
     if isinstance(seq, list):
@@ -220,22 +429,12 @@ def _extract_bits_by_output(output_event: OutputEvent, mapping: List[MappingEntr
                 if idx < 0:
                     continue
 
-                bucket = active_by_output.setdefault(output_id, set())
-                bucket.add(idx)
-
-                if output_id not in configured_n or idx + 1 > configured_n[output_id]:
-                    configured_n[output_id] = idx + 1
-
-    bits_by_output: Dict[str, List[int]] = {}
-
-    for output_id, width in configured_n.items():
-        if width <= 0:
-            continue
-        bits = [0] * width
-        for idx in active_by_output.get(output_id, set()):
-            if 0 <= idx < width:
-                bits[idx] = 1
-        bits_by_output[output_id] = bits
+                row = bits_by_output.get(output_id)
+                if row is None:
+                    row = bits_by_output[output_id] = bytearray(idx + 1)
+                elif idx >= len(row):
+                    row.extend(bytes(idx + 1 - len(row)))
+                row[idx] = 1
 
     return bits_by_output
 
@@ -259,42 +458,83 @@ class GenericSpikeDecoder:
 
     def __init__(self, mapping: Iterable[Union[MappingEntry, Dict[str, Any]]]) -> None:
         self.mapping = normalize_mapping(mapping)
+        # Row buffers reused across decode calls; rows never escape decode,
+        # so in-place re-zeroing between calls is safe.
+        self._row_pool: Dict[str, bytearray] = {}
+        # Declared row widths resolved once here instead of per event.
+        self._widths = _configured_widths(self.mapping)
+        # Specialized bits -> delta closures, one per entry.
+        self._compiled = [
+            (entry.output_id, entry.channel, _compile_entry(entry))
+            for entry in self.mapping
+        ]
 
     def decode(self, output_event: Dict[str, Any], context: Dict[str, Any]) -> Command:
         step = int(output_event.get("step", -1))
-        bits_by_output = _extract_bits_by_output(output_event, self.mapping)
+        bits_by_output = _extract_bits_by_output(
+            output_event,
+            self.mapping,
+            pool=self._row_pool,
+            widths=self._widths,
+        )
 
-        deltas: Dict[str, float] = {}
+        # defaultdict turns the accumulate into one hash lookup per entry
+        # instead of a .get plus a store.
+        deltas: Dict[str, float] = defaultdict(float)
+
+        # Quiet outputs are common between spikes; a row with no set bits
+        # can only produce zero deltas, so drop those rows here — one scan
+        # per output, not one per mapping entry referencing it.
+        active_bits = {
+            output_id: bits
+            for output_id, bits in bits_by_output.items()
+            if any(bits)
+        }
 
-        for entry in self.mapping:
-            bits = bits_by_output.get(entry.output_id)
+        get_bits = active_bits.get
+        for output_id, channel, run in self._compiled:
+            bits = get_bits(output_id)
             if bits is None:
                 continue
 
-            value = _compute_value(bits, entry)
-            delta = _value_to_delta(value, entry)
+            delta = run(bits)
             if delta == 0.0:
                 continue
 
-            deltas[entry.channel] = deltas.get(entry.channel, 0.0) + delta
+            deltas[channel] += delta
 
         return {
             "t": step,
-            "deltas": deltas,
+            # Plain dict out: callers (and json serialization) never see
+            # the defaultdict's insert-on-miss behavior.
+            "deltas": dict(deltas),
         }
 
 
+@functools.lru_cache(maxsize=1024)
+def _channel_joint_index(key: str) -> int:
+    """Index parsed from a "<name>:<idx>" channel key; -1 when malformed.
+
+    Channel names repeat every command, so the split+int runs once per
+    distinct key instead of once per call.
+    """
+    try:
+        return int(key.split(":", 1)[1])
+    except (IndexError, ValueError):
+        return -1
+
+
 def deltas_to_dq_dg(deltas: Dict[str, float], *, dof: int, joint_prefix: str = "joint:") -> Dict[str, Any]:
     dq = [0.0] * int(dof)
     dg = 0.0
     for k, v in deltas.items():
         if k.startswith(joint_prefix):
-            try:
-                idx = int(k.split(":", 1)[1])
-                if 0 <= idx < len(dq):
+            idx = _channel_joint_index(k)
+            if 0 <= idx < len(dq):
+                try:
                     dq[idx] += float(v)
-            except Exception:
-                continue
+                except Exception:
+                    continue
         elif k == "dg" or k == "gripper":
             dg += float(v)
     return {"dq": dq, "dg": dg}
\ No newline at end of file
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, List, Optional
+import functools
 import math
 from .maps import InputSensorMap
 
@@ -180,6 +181,7 @@ class SpikeEncoder:
         raise ValueError(f"unsupported encoder mode: {selected_mode}")
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def _default_mode_for_kind(kind: Optional[str]) -> str:
         """
         Map frontend modality `kind` to an encoding family.
@@ -207,6 +209,10 @@ class SpikeEncoder:
     def _vector_to_n(signal: Any, n: Optional[int]) -> List[float]:
         if isinstance(signal, (list, tuple)):
             values = [float(x) for x in signal]
+        elif isinstance(signal, (bytes, bytearray, memoryview)):
+            # Buffer-protocol signals (e.g. a memoryview over a reusable
+            # capture buffer) are iterated directly — no intermediate list.
+            values = [float(x) for x in signal]
         elif hasattr(signal, "tolist"):
             values = [float(x) for x in signal.tolist()]
         else:
@@ -247,9 +253,10 @@ class SpikeEncoder:
         left = max(0, q - radius)
         right = min(n - 1, q + radius)
 
+        # Slice assignment sets the active window in C instead of a
+        # per-index Python loop.
         out = [0.0] * n
-        for i in range(left, right + 1):
-            out[i] = 1.0
+        out[left:right + 1] = [1.0] * (right - left + 1)
         return out
 
     @classmethod
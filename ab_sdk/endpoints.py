@@ -1,5 +1,19 @@
 """Endpoint constants for brokered and direct realtime flows."""
 
+import functools
+
+
+@functools.lru_cache(maxsize=256)
+def resolve(template: str, **fields: str) -> str:
+    """Format an endpoint template, caching the rendered path.
+
+    Hot polling paths resolve the same (template, ids) pair on every call;
+    caching skips the str.format parse + allocation per request.
+    """
+    return template.format(**fields)
+
+
+
 # Node broker
 NODE_INITIALIZE = "/robots/realtime/{project_id}/initialize"
 NODE_TELEMETRY_START = "/robots/realtime/{project_id}/telemetry"
@@ -1,5 +1,22 @@
-from .input_sensor_map import InputSensorMap
-from .output_motor_map import OutputMotorMap
-from .reward_map import RewardMap
+import importlib
+
+_LAZY = {
+    "InputSensorMap": ".input_sensor_map",
+    "OutputMotorMap": ".output_motor_map",
+    "RewardMap": ".reward_map",
+}
 
 __all__ = ["InputSensorMap", "OutputMotorMap", "RewardMap"]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
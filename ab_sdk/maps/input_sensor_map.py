@@ -25,21 +25,27 @@ class InputSensorMap:
         self.by_input_id: Dict[str, InputBinding] = {}
         self.by_sensor: Dict[str, InputBinding] = {}
 
+        # Single pass with both indexes filled together; bound locals avoid
+        # repeated attribute lookups on large contracts.
+        by_input_id = self.by_input_id
+        by_sensor = self.by_sensor
+
         for raw in entries or []:
-            input_id = str(raw.get("inputId") or raw.get("input_id") or "").strip()
-            sensor = str(raw.get("sensor") or raw.get("name") or input_id).strip()
-            kind = str(raw.get("kind") or "Unknown").strip()
-            n = raw.get("n")
+            get = raw.get
+            input_id = str(get("inputId") or get("input_id") or "").strip()
+            sensor = str(get("sensor") or get("name") or input_id).strip()
+            kind = str(get("kind") or "Unknown").strip()
+            n = get("n")
             n = int(n) if n is not None else None
             if not input_id:
                 raise ValueError("input sensor map entry missing inputId")
-            if input_id in self.by_input_id:
+            if input_id in by_input_id:
                 raise ValueError(f"duplicate inputId in input sensor map: {input_id}")
-            if sensor in self.by_sensor:
+            if sensor in by_sensor:
                 raise ValueError(f"duplicate sensor in input sensor map: {sensor}")
             binding = InputBinding(input_id=input_id, sensor=sensor, kind=kind, n=n, meta=dict(raw))
-            self.by_input_id[input_id] = binding
-            self.by_sensor[sensor] = binding
+            by_input_id[input_id] = binding
+            by_sensor[sensor] = binding
 
     @classmethod
     def from_contract(cls, contract: Dict[str, Any]) -> "InputSensorMap":
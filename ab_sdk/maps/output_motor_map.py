@@ -17,20 +17,24 @@ class OutputMotorMap:
         self.by_output_id: Dict[str, OutputBinding] = {}
         self.by_motor: Dict[str, OutputBinding] = {}
 
+        by_output_id = self.by_output_id
+        by_motor = self.by_motor
+
         for raw in entries or []:
-            output_id = str(raw.get("outputId") or raw.get("output_id") or "").strip()
-            motor = str(raw.get("motor") or raw.get("name") or output_id).strip()
-            motor_id = raw.get("motorId") or raw.get("motor_id")
+            get = raw.get
+            output_id = str(get("outputId") or get("output_id") or "").strip()
+            motor = str(get("motor") or get("name") or output_id).strip()
+            motor_id = get("motorId") or get("motor_id")
             motor_id = str(motor_id) if motor_id is not None else None
             if not output_id:
                 raise ValueError("output motor map entry missing outputId")
-            if output_id in self.by_output_id:
+            if output_id in by_output_id:
                 raise ValueError(f"duplicate outputId in output motor map: {output_id}")
-            if motor in self.by_motor:
+            if motor in by_motor:
                 raise ValueError(f"duplicate motor in output motor map: {motor}")
             binding = OutputBinding(output_id=output_id, motor=motor, motor_id=motor_id, meta=dict(raw))
-            self.by_output_id[output_id] = binding
-            self.by_motor[motor] = binding
+            by_output_id[output_id] = binding
+            by_motor[motor] = binding
 
     @classmethod
     def from_contract(cls, contract: Dict[str, Any]) -> "OutputMotorMap":
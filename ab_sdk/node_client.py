@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import threading
 from typing import Any, Dict, Optional
 
 import httpx
 
 from . import endpoints
 
+try:
+    import h2  # noqa: F401  # optional: install via `artificialbrains_sdk[http2]`
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class NodeRealtimeClient:
     def __init__(self, base_url: str, *, api_key: Optional[str] = None, timeout: float = 20.0) -> None:
@@ -16,6 +24,9 @@ class NodeRealtimeClient:
         if api_key:
             headers["x-api-key"] = api_key
             headers["Authorization"] = f"Bearer {api_key}"
+        # Explicit keep-alive so aggressive proxies keep the pooled
+        # TCP+TLS sockets warm between polls.
+        headers["Connection"] = "keep-alive"
         self.http = httpx.Client(
             base_url=self.base_url,
             headers=headers,
@@ -25,39 +36,62 @@ class NodeRealtimeClient:
                 write=10.0,
                 pool=5.0,
             ),
-            limits=httpx.Limits(
-                max_connections=100,
-                max_keepalive_connections=50,
+            # Pool limits and HTTP/2 must be configured on the transport:
+            # when an explicit transport is passed, httpx ignores the
+            # Client-level `limits=`/`http2=` kwargs entirely.
+            transport=httpx.HTTPTransport(
+                retries=1,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0,
+                ),
             ),
         )
+        self._warm_up()
+
+    def _warm_up(self) -> None:
+        """Finish the TCP+TLS handshake in the background, best-effort."""
+
+        def probe() -> None:
+            try:
+                self.http.head("/", timeout=5.0)
+            except Exception:
+                pass
+
+        threading.Thread(target=probe, daemon=True, name="ABWarmUp:node").start()
+
+    def close(self) -> None:
+        self.http.close()
 
     def initialize(self, project_id: str, **kwargs: Any) -> Dict[str, Any]:
-        path = endpoints.NODE_INITIALIZE.format(project_id=project_id)
+        path = endpoints.resolve(endpoints.NODE_INITIALIZE, project_id=project_id)
         resp = self.http.post(path, json={**kwargs})
         return self._json_or_raise(resp, "initialize")
 
     def start_telemetry(self, project_id: str, compile_id: str) -> Dict[str, Any]:
-        path = endpoints.NODE_TELEMETRY_START.format(project_id=project_id)
+        path = endpoints.resolve(endpoints.NODE_TELEMETRY_START, project_id=project_id)
         resp = self.http.post(path, json={"compileId": compile_id})
         return self._json_or_raise(resp, "start_telemetry")
 
     def run_stop(self, project_id: str, compile_id: str) -> Dict[str, Any]:
-        path = endpoints.NODE_RUN_STOP.format(project_id=project_id)
+        path = endpoints.resolve(endpoints.NODE_RUN_STOP, project_id=project_id)
         resp = self.http.post(path, json={"compileId": compile_id})
         return self._json_or_raise(resp, "run_stop")
 
     def sdk_run_stopped(self, project_id: str, compile_id: str) -> Dict[str, Any]:
-        path = endpoints.NODE_SDK_RUN_STOPPED.format(project_id=project_id)
+        path = endpoints.resolve(endpoints.NODE_SDK_RUN_STOPPED, project_id=project_id)
         resp = self.http.post(path, json={"compileId": compile_id})
         return self._json_or_raise(resp, "sdk_run_stopped")
 
     def get_session(self, project_id: str, compile_id: str) -> Dict[str, Any]:
-        path = endpoints.NODE_SESSION.format(project_id=project_id, compile_id=compile_id)
+        path = endpoints.resolve(endpoints.NODE_SESSION, project_id=project_id, compile_id=compile_id)
         resp = self.http.get(path)
         return self._json_or_raise(resp, "get_session")
     
     def claim_webots_credentials(self, project_id: str, temp_token: str) -> Dict[str, Any]:
-        path = endpoints.NODE_WEBOTS_CREDENTIALS.format(project_id=project_id)
+        path = endpoints.resolve(endpoints.NODE_WEBOTS_CREDENTIALS, project_id=project_id)
         resp = self.http.post(
             path,
             json={
@@ -71,7 +105,7 @@ class NodeRealtimeClient:
         return self._json_or_raise(resp, "claim_webots_credentials")
 
     def checkpoint(self, project_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        path = endpoints.NODE_CHECKPOINT.format(project_id=project_id)
+        path = endpoints.resolve(endpoints.NODE_CHECKPOINT, project_id=project_id)
         print(
             "[AB][NODE][CHECKPOINT] POST",
             {
@@ -94,7 +128,7 @@ class NodeRealtimeClient:
         return self._json_or_raise(resp, "checkpoint")
 
     def publish_output(self, project_id: str, compile_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        path = endpoints.NODE_OUTPUT_TELEMETRY.format(
+        path = endpoints.resolve(endpoints.NODE_OUTPUT_TELEMETRY,
             project_id=project_id,
             compile_id=compile_id,
         )
@@ -122,7 +156,7 @@ class NodeRealtimeClient:
         return self._json_or_raise(resp, "publish_output")
 
     def clear_output_cache(self, project_id: str, compile_id: str) -> Dict[str, Any]:
-        path = endpoints.NODE_OUTPUT_TELEMETRY_CLEAR.format(
+        path = endpoints.resolve(endpoints.NODE_OUTPUT_TELEMETRY_CLEAR,
             project_id=project_id,
             compile_id=compile_id,
         )
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import queue
 import threading
-import time
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Optional
 
 from .python_client import PythonRealtimeClient
 
+# Wakes the dispatch worker for shutdown; never handed to handlers.
+_STOP_DISPATCH = object()
+
+# Placeholder payload for latest-only handlers: the worker resolves it
+# from the handler's single latest slot at execution time, so queued-up
+# intermediates collapse to the newest item.
+_LATEST = object()
+
 
 class OutputStream:
     """Simple polling-based output stream.
@@ -15,6 +23,13 @@ class OutputStream:
     The SDK treats Python outputs as a realtime stream. The first transport here
     is polling for simplicity, but the class boundary makes it easy to swap in a
     socket/SSE/WebSocket transport later.
+
+    With ``async_handlers=True`` handlers run on a dedicated worker thread
+    fed by a bounded queue, so a slow handler delays other handlers but
+    never the polling loop itself. Order is preserved (single worker);
+    when the queue is full the oldest pending dispatch is dropped. A
+    handler exception in this mode is logged instead of killing the
+    stream.
     """
 
     def __init__(
@@ -24,36 +39,142 @@ class OutputStream:
         compile_id: str,
         poll_interval: float = 0.05,
         limit: int = 100,
+        async_handlers: bool = False,
     ) -> None:
         self.python_client = python_client
         self.compile_id = compile_id
         self.poll_interval = poll_interval
         self.limit = limit
         self.after_step: Optional[int] = None
-        self._handlers: List[Callable[[Dict], None]] = []
-        self._control_handlers: List[Callable[[Dict], None]] = []
+        # Tuples rebound on registration: dispatch iterates them without
+        # a per-item defensive copy.
+        self._handlers: tuple = ()
+        self._control_handlers: tuple = ()
         self.latest_item: Optional[Dict] = None
         self._running = False
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self.async_handlers = bool(async_handlers)
+        self._dispatch_q: Optional[queue.Queue] = (
+            queue.Queue(maxsize=1024) if self.async_handlers else None
+        )
+        self._dispatch_thread: Optional[threading.Thread] = None
+        # Latest-wins coalescing: one slot per latest-only handler, plus a
+        # counter of coalesced/shed dispatches so users can tell when their
+        # handlers are falling behind.
+        self._latest_handlers: set = set()
+        self._latest_slots: Dict[Any, Any] = {}
+        self._latest_lock = threading.Lock()
+        self.dropped_dispatches = 0
 
-    def on_item(self, handler: Callable[[Dict], None]) -> None:
-        self._handlers.append(handler)
+    def on_item(self, handler: Callable[[Dict], None], *, latest_only: bool = False) -> None:
+        """Register an item handler.
+
+        ``latest_only=True`` marks the handler as safe to coalesce: when
+        async dispatch backlogs, intermediate items for it are skipped and
+        only the most recent is delivered. Ignored in synchronous mode.
+        """
+        self._handlers = self._handlers + (handler,)
+        if latest_only:
+            self._latest_handlers.add(handler)
     
     def on_control(self, handler: Callable[[Dict], None]) -> None:
-        self._control_handlers.append(handler)
+        self._control_handlers = self._control_handlers + (handler,)
 
     def start(self) -> None:
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
+        if self._dispatch_q is not None:
+            self._dispatch_thread = threading.Thread(
+                target=self._dispatch_worker,
+                daemon=True,
+                name=f"OutputDispatch:{self.compile_id}",
+            )
+            self._dispatch_thread.start()
         self._thread = threading.Thread(target=self._worker, daemon=True, name=f"OutputStream:{self.compile_id}")
         self._thread.start()
 
     def stop(self) -> None:
         self._running = False
+        self._stop_event.set()
         if self._thread and self._thread is not threading.current_thread():
             self._thread.join(timeout=2.0)
         self._thread = None
+        if self._dispatch_q is not None and self._dispatch_thread:
+            self._enqueue_dispatch(_STOP_DISPATCH)
+            if self._dispatch_thread is not threading.current_thread():
+                self._dispatch_thread.join(timeout=2.0)
+            self._dispatch_thread = None
+
+    def _dispatch(self, handler: Callable[[Dict], None], payload: Dict) -> None:
+        if self._dispatch_q is None:
+            handler(payload)
+            return
+
+        if handler in self._latest_handlers:
+            with self._latest_lock:
+                pending = handler in self._latest_slots
+                self._latest_slots[handler] = payload
+            if pending:
+                # A marker for this handler is already queued; it will pick
+                # up this newer payload and the intermediate one is skipped.
+                self._count_dropped()
+                return
+            self._enqueue_dispatch((handler, _LATEST))
+            return
+
+        self._enqueue_dispatch((handler, payload))
+
+    def _enqueue_dispatch(self, task) -> None:
+        q = self._dispatch_q
+        while True:
+            try:
+                q.put_nowait(task)
+                return
+            except queue.Full:
+                # Handlers are behind; shed the oldest pending dispatch
+                # rather than stalling the polling loop.
+                try:
+                    shed = q.get_nowait()
+                except queue.Empty:
+                    continue
+                if shed is not _STOP_DISPATCH and shed[1] is _LATEST:
+                    # Its slot must be cleared, or the handler would look
+                    # permanently pending and never be dispatched again.
+                    with self._latest_lock:
+                        self._latest_slots.pop(shed[0], None)
+                self._count_dropped()
+
+    def _count_dropped(self) -> None:
+        self.dropped_dispatches += 1
+        if self.dropped_dispatches % 100 == 0:
+            print(
+                f"[AB][OUTPUT][BACKLOG] handlers behind: "
+                f"{self.dropped_dispatches} dispatches coalesced/dropped",
+                flush=True,
+            )
+
+    def _dispatch_worker(self) -> None:
+        q = self._dispatch_q
+        while True:
+            task = q.get()
+            if task is _STOP_DISPATCH:
+                return
+            handler, payload = task
+            if payload is _LATEST:
+                with self._latest_lock:
+                    payload = self._latest_slots.pop(handler, _LATEST)
+                if payload is _LATEST:
+                    continue
+            try:
+                handler(payload)
+            except Exception as exc:
+                print(
+                    f"[AB][OUTPUT][HANDLER_ERROR] {type(exc).__name__}: {exc}",
+                    flush=True,
+                )
 
     def _worker(self) -> None:
         while self._running:
@@ -68,15 +189,15 @@ class OutputStream:
                     f"[AB][OUTPUT][STREAM_ERROR] {type(exc).__name__}: {exc}",
                     flush=True,
                 )
-                time.sleep(self.poll_interval)
+                self._stop_event.wait(self.poll_interval)
                 continue
 
             # CONTROL CHANNEL TO STOP STREAM
             control = payload.get("control")
             if control:
                 print(f"[AB][CONTROL][STREAM] {control}")
-                for handler in list(self._control_handlers):
-                    handler(control)
+                for handler in self._control_handlers:
+                    self._dispatch(handler, control)
                 if control.get("command") == "stop":
                     self._running = False
                     return
@@ -86,6 +207,8 @@ class OutputStream:
                 self.after_step = payload.get("next_after_step")
                 for item in items:
                     self.latest_item = item
-                    for handler in list(self._handlers):
-                        handler(item)
-            time.sleep(self.poll_interval)
+                    for handler in self._handlers:
+                        self._dispatch(handler, item)
+            # Interruptible sleep: stop() wakes the worker immediately
+            # instead of after up to one poll interval.
+            self._stop_event.wait(self.poll_interval)
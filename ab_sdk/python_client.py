@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Optional
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 import httpx
 
 from . import endpoints
+from .node_client import HTTP2_AVAILABLE
+
+# Hot-path debug prints build (and repr) a dict per call; AB_SDK_VERBOSE=0
+# skips that work entirely. Default keeps the existing logging behavior.
+_VERBOSE = os.getenv("AB_SDK_VERBOSE", "1").strip().lower() not in {"0", "false", "no", "off"}
 
 
 class PythonRealtimeClient:
@@ -17,16 +25,26 @@ class PythonRealtimeClient:
         api_key: Optional[str] = None,
         project_id: Optional[str] = None,
         timeout: float = 20.0,
+        outputs_ttl: float = 0.0,
     ) -> None:
         if not base_url:
             raise ValueError("python base_url must be provided")
         self.base_url = base_url.rstrip("/")
+        # outputs_ttl > 0 coalesces overlapping get_outputs calls from
+        # multiple threads into one HTTP GET; 0 preserves direct behavior.
+        self.outputs_ttl = float(outputs_ttl)
+        self._outputs_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+        self._outputs_inflight: Dict[Tuple[Any, ...], threading.Event] = {}
+        self._outputs_lock = threading.Lock()
         headers: Dict[str, str] = {}
         if project_id:
             headers["x-project-id"] = project_id
         if api_key:
             headers["x-api-key"] = api_key
             headers["Authorization"] = f"Bearer {api_key}"
+        # Explicit keep-alive so aggressive proxies keep the pooled
+        # TCP+TLS sockets warm between polls.
+        headers["Connection"] = "keep-alive"
         self.http = httpx.Client(
             base_url=self.base_url,
             headers=headers,
@@ -36,11 +54,34 @@ class PythonRealtimeClient:
                 write=10.0,
                 pool=5.0,
             ),
-            limits=httpx.Limits(
-                max_connections=100,
-                max_keepalive_connections=80,
+            # Pool limits and HTTP/2 must be configured on the transport:
+            # when an explicit transport is passed, httpx ignores the
+            # Client-level `limits=`/`http2=` kwargs entirely.
+            transport=httpx.HTTPTransport(
+                retries=1,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0,
+                ),
             ),
         )
+        self._warm_up()
+
+    def _warm_up(self) -> None:
+        """Finish the TCP+TLS handshake in the background, best-effort."""
+
+        def probe() -> None:
+            try:
+                self.http.head("/", timeout=5.0)
+            except Exception:
+                pass
+
+        threading.Thread(target=probe, daemon=True, name="ABWarmUp:python").start()
+
+    def close(self) -> None:
+        self.http.close()
 
     def compile_direct(
         self,
@@ -77,8 +118,12 @@ class PythonRealtimeClient:
         return resp.json()
 
     def send_input(self, *, payload: Dict[str, Any],) -> Dict[str, Any]:
+        # Hot path: only pay for raise_for_status outside the 2xx case.
+        # is_success (not status_code >= 400) so 1xx/3xx still raise like
+        # raise_for_status() would instead of json-decoding a redirect body.
         resp = self.http.post(endpoints.PY_INPUTS, json=payload)
-        resp.raise_for_status()
+        if not resp.is_success:
+            resp.raise_for_status()
         return resp.json()
 
     def send_global_reward(
@@ -96,7 +141,8 @@ class PythonRealtimeClient:
             "drive": float(drive) if drive is not None else None,
             "meta": meta or {},
         }
-        print("[AB][SEND_GLOBAL_REWARD]", payload, flush=True)
+        if _VERBOSE:
+            print("[AB][SEND_GLOBAL_REWARD]", payload, flush=True)
         resp = self.http.post(endpoints.PY_REWARDS, json=payload)
         resp.raise_for_status()
         return resp.json()
@@ -111,7 +157,8 @@ class PythonRealtimeClient:
                 "value": float(value),
                 "meta": meta or {},
             }
-            print("[AB][SEND_LOCAL_REWARDS]", payload, flush=True)
+            if _VERBOSE:
+                print("[AB][SEND_LOCAL_REWARDS]", payload, flush=True)
             resp = self.http.post(endpoints.PY_REWARDS, json=payload)
             if resp.status_code >= 400:
                 print(
@@ -154,48 +201,110 @@ class PythonRealtimeClient:
             ],
         }
 
-        print("[AB][SEND_LOCAL_REWARDS_BATCH]", payload, flush=True)
+        if _VERBOSE:
+            print("[AB][SEND_LOCAL_REWARDS_BATCH]", payload, flush=True)
 
         resp = self.http.post(endpoints.PY_REWARDS, json=payload)
         resp.raise_for_status()
         return resp.json()
 
     def get_outputs(self, *, compile_id: str, after_step: Optional[int] = None, limit: int = 100) -> Dict[str, Any]:
+        if self.outputs_ttl > 0:
+            return self._get_outputs_coalesced(
+                compile_id=compile_id,
+                after_step=after_step,
+                limit=limit,
+            )
+        return self._get_outputs_direct(
+            compile_id=compile_id,
+            after_step=after_step,
+            limit=limit,
+        )
+
+    def _get_outputs_coalesced(self, *, compile_id: str, after_step: Optional[int], limit: int) -> Dict[str, Any]:
+        key = (compile_id, after_step, limit)
+
+        while True:
+            with self._outputs_lock:
+                cached = self._outputs_cache.get(key)
+                if cached and time.monotonic() - cached[0] < self.outputs_ttl:
+                    return cached[1]
+
+                inflight = self._outputs_inflight.get(key)
+                if inflight is None:
+                    inflight = threading.Event()
+                    self._outputs_inflight[key] = inflight
+                    owner = True
+                else:
+                    owner = False
+
+            if not owner:
+                # Another thread is already polling; share its response.
+                inflight.wait()
+                continue
+
+            try:
+                payload = self._get_outputs_direct(
+                    compile_id=compile_id,
+                    after_step=after_step,
+                    limit=limit,
+                )
+                now = time.monotonic()
+                with self._outputs_lock:
+                    # Evict expired entries on insert. The key includes
+                    # after_step, which advances on every poll, so without
+                    # eviction each poll would permanently pin a full
+                    # outputs payload and the cache would grow unbounded.
+                    cache = self._outputs_cache
+                    ttl = self.outputs_ttl
+                    for stale in [k for k, (ts, _) in cache.items() if now - ts >= ttl]:
+                        del cache[stale]
+                    cache[key] = (now, payload)
+                return payload
+            finally:
+                with self._outputs_lock:
+                    self._outputs_inflight.pop(key, None)
+                inflight.set()
+
+    def _get_outputs_direct(self, *, compile_id: str, after_step: Optional[int], limit: int) -> Dict[str, Any]:
         params: Dict[str, Any] = {"limit": limit}
         if after_step is not None:
             params["after_step"] = after_step
-        path = endpoints.PY_OUTPUTS.format(compile_id=compile_id)
+        path = endpoints.resolve(endpoints.PY_OUTPUTS, compile_id=compile_id)
         resp = self.http.get(path, params=params)
-        resp.raise_for_status()
+        if not resp.is_success:
+            resp.raise_for_status()
         payload = resp.json()
-        print(
-            "[AB][GET_OUTPUTS]",
-            {
-                "base_url": self.base_url,
-                "compile_id": compile_id,
-                "after_step": after_step,
-                "keys": list(payload.keys()),
-                "control": payload.get("control"),
-            },
-            flush=True,
-        )
+        if _VERBOSE:
+            print(
+                "[AB][GET_OUTPUTS]",
+                {
+                    "base_url": self.base_url,
+                    "compile_id": compile_id,
+                    "after_step": after_step,
+                    "keys": list(payload.keys()),
+                    "control": payload.get("control"),
+                },
+                flush=True,
+            )
         return payload
     
     def get_weights(self, *, compile_id: str) -> Dict[str, Any]:
-        path = endpoints.PY_WEIGHTS.format(compile_id=compile_id)
+        path = endpoints.resolve(endpoints.PY_WEIGHTS, compile_id=compile_id)
         resp = self.http.get(path)
         resp.raise_for_status()
         payload = resp.json()
-        print(
-            "[AB][GET_WEIGHTS]",
-            {
-                "base_url": self.base_url,
-                "compile_id": compile_id,
-                "step": payload.get("step"),
-                "has_weights": bool(payload.get("weights")),
-            },
-            flush=True,
-        )
+        if _VERBOSE:
+            print(
+                "[AB][GET_WEIGHTS]",
+                {
+                    "base_url": self.base_url,
+                    "compile_id": compile_id,
+                    "step": payload.get("step"),
+                    "has_weights": bool(payload.get("weights")),
+                },
+                flush=True,
+            )
         return payload
     
     def clone(self) -> "PythonRealtimeClient":
@@ -204,4 +313,5 @@ class PythonRealtimeClient:
             api_key=self.http.headers.get("x-api-key"),
             project_id=self.http.headers.get("x-project-id"),
             timeout=20.0,
+            outputs_ttl=self.outputs_ttl,
         )
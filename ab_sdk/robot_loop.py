@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import sys
 import threading
 import time
@@ -9,6 +10,7 @@ import httpx
 from dataclasses import dataclass, field
 from typing import Any, Callable, Mapping, Optional
 
+from .python_client import _VERBOSE
 from .session import RealtimeSession
 
 
@@ -122,11 +124,14 @@ class RobotLoop:
         self.exploratory_rewards = bool(exploratory_rewards)
         self.exploratory_output_ratio = float(exploratory_output_ratio)
         self.exploratory_min_abs_delta = float(exploratory_min_abs_delta)
+        # Resolved once: sensor lookup table used on every publish.
+        self._by_sensor = session.input_map.by_sensor
         self._exploration_complete = False
         self._pending_layer_rewards: dict[str, dict[str, Any]] = {}
         self._reward_lock = threading.Lock()
 
         self._running = False
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._input_flush_thread: Optional[threading.Thread] = None
         self._input_threads: list[threading.Thread] = []
@@ -134,7 +139,9 @@ class RobotLoop:
 
         self._input_buffer: dict[str, dict[str, Any]] = {}
         self._input_lock = threading.Lock()
-        self._input_send_seq = 0
+        # itertools.count increments atomically in C — send threads never
+        # contend on the buffer lock just to draw a sequence number.
+        self._input_send_seq = itertools.count(1)
 
         if auto_register_command_handler:
             self.session.on_command(self._handle_command)
@@ -145,6 +152,7 @@ class RobotLoop:
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         if self.input_mode == "parallel":
             self._start_parallel_inputs()
             self._start_input_flush_loop()
@@ -159,6 +167,7 @@ class RobotLoop:
 
     def stop(self) -> None:
         self._running = False
+        self._stop_event.set()
         for thread in self._input_threads:
             if thread is not threading.current_thread():
                 thread.join(timeout=2.0)
@@ -182,27 +191,43 @@ class RobotLoop:
     def run_forever(self) -> None:
         self.start()
         try:
-            while self._running:
-                time.sleep(0.1)
+            # Event-driven: wakes immediately on stop() instead of polling
+            # the flag every 100 ms.
+            self._stop_event.wait()
         except KeyboardInterrupt:
             pass
         finally:
             self.stop()
 
+    def _pace(self, deadline: float, interval: float) -> float:
+        """Wait until ``deadline`` and return the next one.
+
+        Deadlines advance by whole intervals from a fixed phase, so small
+        per-tick jitter does not accumulate into rate drift. After an
+        overrun the schedule re-anchors at now instead of bursting to
+        catch up. The wait rides on the stop event, so stop() interrupts
+        it immediately.
+        """
+        now = time.monotonic()
+        delay = deadline - now
+        if delay > 0:
+            self._stop_event.wait(delay)
+            return deadline + interval
+        return now + interval
+
     def _worker(self) -> None:
         interval = 1.0 / self.tick_hz if self.tick_hz > 0 else 0.05
+        deadline = time.monotonic() + interval
 
         try:
             while self._running:
-                started = time.time()
-
                 self._publish_inputs()
                 self._publish_rewards()
 
-                elapsed = time.time() - started
-                time.sleep(max(0.0, interval - elapsed))
+                deadline = self._pace(deadline, interval)
         except Exception as exc:
             self._running = False
+            self._stop_event.set()
             print(f"[AB] RobotLoop crashed: {exc}", file=sys.stderr)
             try:
                 self.session.stop(notify_node=True)
@@ -218,10 +243,21 @@ class RobotLoop:
         if not isinstance(payload, Mapping):
             raise TypeError("state_provider must return a mapping of sensor -> signal")
 
-        known_sensors = self.session.input_map.by_sensor
-
+        # One request per tick: all sensor events ride in a single POST
+        # instead of one round trip per sensor.
+        events = []
         for sensor, signal in payload.items():
-            self._publish_one_input(sensor, signal)
+            event = self._encode_one_input(sensor, signal)
+            if event is not None:
+                events.append(event)
+
+        if events:
+            self.session.input_client.send_input(
+                payload={
+                    "compileId": self.session.compile_id,
+                    "events": events,
+                }
+            )
 
     def _publish_rewards(self) -> None:
         if self.reward_provider is None:
@@ -273,7 +309,7 @@ class RobotLoop:
             )
 
         for sensor, provider in self.sensor_providers.items():
-            if sensor not in self.session.input_map.by_sensor:
+            if sensor not in self._by_sensor:
                 if self.strict:
                     raise KeyError(f"unknown sensor '{sensor}'")
                 continue
@@ -302,10 +338,9 @@ class RobotLoop:
 
     def _sensor_worker(self, sensor: str, provider: Callable[[], Any]) -> None:
         interval = 1.0 / self.input_hz if self.input_hz > 0 else 0.01
+        deadline = time.monotonic() + interval
 
         while self._running:
-            started = time.time()
-
             try:
                 signal = provider()
                 self._publish_one_input(sensor, signal)
@@ -328,16 +363,14 @@ class RobotLoop:
                     flush=True,
                 )
 
-            elapsed = time.time() - started
-            time.sleep(max(0.0, interval - elapsed))
+            deadline = self._pace(deadline, interval)
 
 
     def _reward_worker(self) -> None:
         interval = 1.0 / self.reward_hz if self.reward_hz > 0 else 0.25
+        deadline = time.monotonic() + interval
 
         while self._running:
-            started = time.time()
-
             try:
                 self._publish_reward_cycle()
             except httpx.TimeoutException as exc:
@@ -345,8 +378,7 @@ class RobotLoop:
             except Exception as exc:
                 print(f"[AB][REWARD][SEND_ERROR] {type(exc).__name__}: {exc}", flush=True)
 
-            elapsed = time.time() - started
-            time.sleep(max(0.0, interval - elapsed))
+            deadline = self._pace(deadline, interval)
 
     def _publish_reward_cycle(self) -> None:
         if self.reward_provider is None:
@@ -396,11 +428,11 @@ class RobotLoop:
 
 
 
-    def _publish_one_input(self, sensor: str, signal: Any) -> None:
-        if sensor not in self.session.input_map.by_sensor:
+    def _encode_one_input(self, sensor: str, signal: Any) -> Optional[dict[str, Any]]:
+        if sensor not in self._by_sensor:
             if self.strict:
                 raise KeyError(f"unknown sensor '{sensor}'")
-            return
+            return None
 
         if isinstance(signal, Mapping):
             encoded = self.session.encoder.encode(
@@ -420,15 +452,20 @@ class RobotLoop:
                 mode=self.encoder_mode,
             )
 
-        event = {
+        return {
             "target": encoded.target,
             "payload": encoded.payload,
             "meta": encoded.meta,
         }
 
+    def _publish_one_input(self, sensor: str, signal: Any) -> None:
+        event = self._encode_one_input(sensor, signal)
+        if event is None:
+            return
+
         if self.input_mode == "parallel":
             with self._input_lock:
-                self._input_buffer[encoded.target] = event
+                self._input_buffer[event["target"]] = event
         else:
             self.session.input_client.send_input(
                 payload={
@@ -447,14 +484,15 @@ class RobotLoop:
 
     def _send_input_batch_async(self, batch: list[dict[str, Any]]) -> None:
         try:
-            with self._input_lock:
-                self._input_send_seq += 1
-                seq = self._input_send_seq
+            seq = next(self._input_send_seq)
             t0 = time.perf_counter()
-            print(
-                f"[AB][INPUT][SEND_START] seq={seq} t={t0:.6f} events={len(batch)}",
-                flush=True,
-            )
+            # Two f-string builds plus stdout flushes per flush tick add up
+            # at input_hz rates; AB_SDK_VERBOSE=0 skips them entirely.
+            if _VERBOSE:
+                print(
+                    f"[AB][INPUT][SEND_START] seq={seq} t={t0:.6f} events={len(batch)}",
+                    flush=True,
+                )
 
             self.session.input_client.send_input(
                 payload={
@@ -463,12 +501,13 @@ class RobotLoop:
                 }
             )
 
-            t1 = time.perf_counter()
-            print(
-                f"[AB][INPUT][SEND_DONE] seq={seq} t={t1:.6f} "
-                f"dt_ms={(t1 - t0) * 1000:.2f}",
-                flush=True,
-            )
+            if _VERBOSE:
+                t1 = time.perf_counter()
+                print(
+                    f"[AB][INPUT][SEND_DONE] seq={seq} t={t1:.6f} "
+                    f"dt_ms={(t1 - t0) * 1000:.2f}",
+                    flush=True,
+                )
 
         except Exception as exc:
             print(f"[AB][INPUT][SEND_ERROR] {exc}", file=sys.stderr, flush=True)
@@ -478,10 +517,9 @@ class RobotLoop:
 
     def _input_flush_worker(self) -> None:
         interval = 1.0 / self.input_hz if self.input_hz > 0 else 0.01
+        deadline = time.monotonic() + interval
 
         while self._running:
-            started = time.time()
-
             with self._input_lock:
                 batch = list(self._input_buffer.values())
                 self._input_buffer.clear()
@@ -495,8 +533,7 @@ class RobotLoop:
                     name=f"ABInputSend:{self.session.compile_id}",
                 ).start()
 
-            elapsed = time.time() - started
-            time.sleep(max(0.0, interval - elapsed))
+            deadline = self._pace(deadline, interval)
 
 
     @staticmethod
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional
 
@@ -17,6 +18,9 @@ class SessionConfig:
     output_limit: int = 100
     checkpoint_every_ticks: int = 250
     output_telemetry: bool = False
+    # Run output/control handlers on a dedicated worker thread instead of
+    # the polling thread, so a slow handler cannot delay the next poll.
+    async_handlers: bool = False
 
 
 class RealtimeSession:
@@ -42,6 +46,15 @@ class RealtimeSession:
         self.reward_map = RewardMap.from_contract(contract)
         self.encoder = SpikeEncoder(self.input_map)
 
+        # Reward routing resolved once: the contract is fixed for the
+        # session, so per-call binding walks and meta lookups are wasted.
+        self._layers_by_output: Dict[str, tuple] = {
+            from_output: tuple(
+                str(binding.meta["layer"]) for binding in bindings
+            )
+            for from_output, bindings in self.reward_map.by_from_output.items()
+        }
+
         self.input_client = python_client.clone()
         self.output_client = python_client.clone()
         self.reward_client = python_client.clone()
@@ -52,14 +65,28 @@ class RealtimeSession:
             compile_id=compile_id,
             poll_interval=config.poll_interval,
             limit=config.output_limit,
+            async_handlers=config.async_handlers,
         )
-        self._output_handlers: list[Callable[[Dict[str, Any]], None]] = []
-        self._command_handlers: list[Callable[[Any], None]] = []
-        self._control_handlers: list[Callable[[Dict[str, Any]], None]] = []
+        # Handler sets are immutable tuples rebound on registration, so
+        # dispatch iterates them directly — no defensive copy per event,
+        # and concurrent registration can never be observed mid-resize.
+        self._output_handlers: tuple[Callable[[Dict[str, Any]], None], ...] = ()
+        self._command_handlers: tuple[Callable[[Any], None], ...] = ()
+        self._control_handlers: tuple[Callable[[Dict[str, Any]], None], ...] = ()
         self._running = False
+        # Non-None while inside batch(): publish_input queues events here
+        # instead of posting them one by one.
+        self._batched_events: Optional[list] = None
         self._last_checkpoint_step = -1
         self._checkpoint_every_steps = int(config.checkpoint_every_ticks or 250)
 
+        # Invariant across the session; built once instead of a fresh dict
+        # per decoded output. Decoders must treat it as read-only.
+        self._decode_context = {
+            "session": self,
+            "contract": contract,
+        }
+
         self.output_stream.on_item(self._dispatch_output)
         self.output_stream.on_control(self._dispatch_control)
 
@@ -76,10 +103,10 @@ class RealtimeSession:
         self.decoder = decoder
 
     def on_output(self, handler: Callable[[Dict[str, Any]], None]) -> None:
-        self._output_handlers.append(handler)
+        self._output_handlers = self._output_handlers + (handler,)
 
     def on_command(self, handler: Callable[[Any], None]) -> None:
-        self._command_handlers.append(handler)
+        self._command_handlers = self._command_handlers + (handler,)
 
     def start_output_stream(self) -> None:
         self.output_stream.start()
@@ -107,12 +134,55 @@ class RealtimeSession:
             radius=radius,
             meta=meta,
         )
+        if self._batched_events is not None:
+            self._batched_events.append(
+                {
+                    "target": encoded.target,
+                    "payload": encoded.payload,
+                    "meta": encoded.meta,
+                }
+            )
+            return {"ok": True, "batched": True}
+
         payload = self.encoder.build_input_request(
             compile_id=self.compile_id,
             encoded=encoded,
         )
         return self.input_client.send_input(payload=payload)
 
+    @contextmanager
+    def batch(self):
+        """Coalesce publish_input calls into a single POST.
+
+        Inside the block each publish_input encodes as usual but only
+        queues its event; on exit all queued events ride in one request
+        instead of one round trip per sensor:
+
+            with session.batch():
+                session.publish_input("camera", frame_vec)
+                session.publish_input("proprioception", fb)
+
+        Nested batch() blocks join the outermost one. Not thread-safe:
+        batch and the publish_input calls must share a thread.
+        """
+        if self._batched_events is not None:
+            yield self
+            return
+
+        self._batched_events = []
+        try:
+            yield self
+        finally:
+            events = self._batched_events
+            self._batched_events = None
+            if events:
+                self.input_client.send_input(
+                    payload={
+                        "compileId": self.compile_id,
+                        "events": events,
+                    }
+                )
+
     def send_global_reward(
         self,
         value: float,
@@ -154,30 +224,31 @@ class RealtimeSession:
         meta: Optional[dict] = None,
     ) -> Dict[str, Any]:
         routed: Dict[str, Any] = {}
-        drives = dict(drives or {})
+        # Read-only below: no need for a defensive copy per call.
+        drives = drives or {}
 
         for from_output, value in rewards.items():
-            bindings = self.reward_map.get_by_output(from_output)
+            layers = self._layers_by_output.get(str(from_output).strip())
 
-            if not bindings:
+            if not layers:
                 raise KeyError(f"unknown local reward output '{from_output}'")
 
             # Calculate once per fromOutput, then expand the same value
             # to every STDP3 layer bound to that fromOutput.
-            for binding in bindings:
-                layer = str(binding.meta["layer"])
-                raw_drive = drives.get(from_output)
+            raw_drive = drives.get(from_output)
 
-                # enforce binary drive {-1, +1}
-                if raw_drive is None:
-                    drive = 1.0
-                else:
-                    drive = 1.0 if float(raw_drive) >= 0.0 else -1.0
+            # enforce binary drive {-1, +1}
+            if raw_drive is None:
+                drive = 1.0
+            else:
+                drive = 1.0 if float(raw_drive) >= 0.0 else -1.0
 
-                routed[layer] = {
-                    "value": float(value),
-                    "drive": drive,
-                }
+            entry = {
+                "value": float(value),
+                "drive": drive,
+            }
+            for layer in layers:
+                routed[layer] = entry
 
         return self.reward_client.send_local_rewards_batch(
             compile_id=self.compile_id,
@@ -248,7 +319,7 @@ class RealtimeSession:
                 )
             except Exception as exc:
                 print(f"[AB][OUTPUT_TELEMETRY][ERROR] {exc}", flush=True)
-        for handler in list(self._output_handlers):
+        for handler in self._output_handlers:
             handler(item)
 
         self._maybe_checkpoint_from_output(item)
@@ -256,29 +327,23 @@ class RealtimeSession:
         if self.decoder is None:
             return
 
-        command = self.decoder.decode(
-            item,
-            context={
-                "session": self,
-                "contract": self.contract,
-            },
-        )
+        command = self.decoder.decode(item, context=self._decode_context)
         if command is None:
             return
-        for handler in list(self._command_handlers):
+        for handler in self._command_handlers:
             handler(command)
 
     def _dispatch_control(self, control: Dict[str, Any]) -> None:
         print(f"[AB][CONTROL] received {control}")
 
-        for handler in list(self._control_handlers):
+        for handler in self._control_handlers:
             handler(control)
 
-        for handler in list(self._command_handlers):
+        for handler in self._command_handlers:
             handler(control)
     
     def on_control(self, handler: Callable[[Dict[str, Any]], None]) -> None:
-        self._control_handlers.append(handler)
+        self._control_handlers = self._control_handlers + (handler,)
     
     def checkpoint(self, *, reason: str = "periodic") -> Optional[Dict[str, Any]]:
         if not self.node_client or not self.project_id:
@@ -362,20 +427,19 @@ class RealtimeSession:
         meta: Optional[dict] = None,
     ) -> Dict[str, Dict[str, Any]]:
         routed: Dict[str, Dict[str, Any]] = {}
-        drives = dict(drives or {})
+        # Read-only below: no need for a defensive copy per call.
+        drives = drives or {}
 
         for from_output, value in rewards.items():
-            bindings = self.reward_map.get_by_output(from_output)
+            layers = self._layers_by_output.get(str(from_output).strip())
 
-            if not bindings:
+            if not layers:
                 raise KeyError(f"unknown local reward output '{from_output}'")
 
-            for binding in bindings:
-                layer = str(binding.meta["layer"])
-                raw_drive = drives.get(from_output)
-
-                drive = None if raw_drive is None else float(raw_drive)
+            raw_drive = drives.get(from_output)
+            drive = None if raw_drive is None else float(raw_drive)
 
+            for layer in layers:
                 routed[layer] = {
                     "value": float(value),
                     "drive": drive,